@@ -7,21 +7,196 @@ This Flask app presents individual transition predictions and allows users
 to judge plausibility and categorize errors.
 """
 
+import atexit
 import json
+import mmap
 import random
 import datetime
 import os
+import sys
+import threading
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask.json.provider import DefaultJSONProvider
 import argparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available.
+
+    Falls back to str() for types JSON has no native encoding for
+    (datetimes, Decimals from ijson, numpy scalars).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                            default=str)
+    return json.dumps(obj, indent=2, default=str).encode('utf-8')
+
+def _dumps_compact(obj) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY, default=str)
+    return json.dumps(obj, default=str).encode('utf-8')
+
+def _dumps_line(obj) -> bytes:
+    """Serialize to a single compact JSON line, trailing newline included."""
+    return _dumps_compact(obj) + b'\n'
+
+def _read_json_file(path):
+    """Parse a JSON file, memory-mapping it to skip the read() copy.
+
+    orjson parses straight out of the mapped pages, so peak memory is the
+    parsed tree alone rather than tree plus raw bytes. Falls back to a
+    plain read for empty files, mmap-hostile filesystems, or when orjson
+    is unavailable (stdlib json does not accept memoryviews).
+    """
+    with open(path, 'rb') as f:
+        if orjson is not None:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return orjson.loads(memoryview(mm))
+            except (ValueError, OSError):
+                pass
+        return _loads(f.read())
+
+def _barcode_name_pairs(materials):
+    """Yield (barcode, name) pairs from a list of material dicts."""
+    for material in materials:
+        barcode = material.get('barcode')
+        name = material.get('name')
+        if barcode is not None and name is not None:
+            yield barcode, name
+
+def _intern_tree(obj, depth: int = 3):
+    """Intern dict keys and string values up to `depth` levels deep.
+
+    JSON parsing allocates a fresh string for every occurrence of repeated
+    values like action names, barcodes and parameter keys; interning
+    collapses the duplicates to a single shared object. The depth limit
+    keeps large leaf strings (e.g. reasoning text) out of the intern table.
+    """
+    if depth <= 0:
+        return obj
+    t = type(obj)
+    if t is str:
+        return sys.intern(obj)
+    if t is dict:
+        return {sys.intern(k): _intern_tree(v, depth - 1) for k, v in obj.items()}
+    if t is list:
+        return [_intern_tree(item, depth - 1) for item in obj]
+    return obj
+
+# Static error taxonomy shared by every session; a module-level tuple so all
+# manager instances (and server threads) reference one object.
+ERROR_CATEGORIES = (
+    {
+        "id": "materials_missing",
+        "label": "Missing Expected Materials",
+        "description": "Expected materials were not predicted"
+    },
+    {
+        "id": "materials_incorrect",
+        "label": "Incorrect Material Properties",
+        "description": "Material properties don't match expected values"
+    },
+    {
+        "id": "materials_extra",
+        "label": "Unexpected Materials",
+        "description": "Materials predicted that shouldn't exist"
+    },
+    {
+        "id": "observations_missing",
+        "label": "Missing Expected Observations",
+        "description": "Expected observations were not predicted"
+    },
+    {
+        "id": "observations_incorrect",
+        "label": "Incorrect Observation Values",
+        "description": "Observation values don't match expected results"
+    },
+    {
+        "id": "observations_extra",
+        "label": "Unexpected Observations",
+        "description": "Observations predicted that shouldn't occur"
+    },
+    {
+        "id": "timing_wrong",
+        "label": "Incorrect Timing",
+        "description": "Events predicted at wrong time points"
+    },
+    {
+        "id": "physical_impossible",
+        "label": "Physically Impossible",
+        "description": "Predictions violate physical laws or constraints"
+    },
+    {
+        "id": "reasoning_flawed",
+        "label": "Flawed Reasoning",
+        "description": "Logical errors in the model's reasoning"
+    },
+    {
+        "id": "context_ignored",
+        "label": "Context Ignored",
+        "description": "Model ignored important contextual information"
+    }
+)
+
 app = Flask(__name__)
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider that routes Flask's jsonify/request parsing through orjson."""
+
+    def dumps(self, obj, **kwargs):
+        # Same default=str safety net as _dumps/_dumps_compact, so stray
+        # Decimals/datetimes in a response become strings instead of a 500
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY,
+                            default=str).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+
 class ValidationManager:
     """Manages the validation data and error categorization process."""
-    
+
+    # Rewrite the full session summary only every N validations; individual
+    # validations are appended to the JSONL log immediately.
+    SESSION_SYNC_INTERVAL = 25
+
+    # Data files at or above this size are stream-parsed with ijson (when
+    # installed) so peak memory stays at one comparison instead of the
+    # whole parsed tree.
+    STREAM_PARSE_THRESHOLD = 64 * 1024 * 1024
+
     def __init__(self, data_file: str, results_dir: str = "validation_results", session_name: str = None, random_seed: int = None):
         self.data_file = data_file
         self.results_dir = Path(results_dir)
@@ -42,60 +217,13 @@ class ValidationManager:
         self.current_transitions = []
         self.completed_transitions = set()
         self.session_validations = []
-        
-        self.error_categories = [
-            {
-                "id": "materials_missing",
-                "label": "Missing Expected Materials",
-                "description": "Expected materials were not predicted"
-            },
-            {
-                "id": "materials_incorrect",
-                "label": "Incorrect Material Properties",
-                "description": "Material properties don't match expected values"
-            },
-            {
-                "id": "materials_extra",
-                "label": "Unexpected Materials",
-                "description": "Materials predicted that shouldn't exist"
-            },
-            {
-                "id": "observations_missing",
-                "label": "Missing Expected Observations",
-                "description": "Expected observations were not predicted"
-            },
-            {
-                "id": "observations_incorrect",
-                "label": "Incorrect Observation Values",
-                "description": "Observation values don't match expected results"
-            },
-            {
-                "id": "observations_extra",
-                "label": "Unexpected Observations",
-                "description": "Observations predicted that shouldn't occur"
-            },
-            {
-                "id": "timing_wrong",
-                "label": "Incorrect Timing",
-                "description": "Events predicted at wrong time points"
-            },
-            {
-                "id": "physical_impossible",
-                "label": "Physically Impossible",
-                "description": "Predictions violate physical laws or constraints"
-            },
-            {
-                "id": "reasoning_flawed",
-                "label": "Flawed Reasoning",
-                "description": "Logical errors in the model's reasoning"
-            },
-            {
-                "id": "context_ignored",
-                "label": "Context Ignored",
-                "description": "Model ignored important contextual information"
-            }
-        ]
-        
+        self._next_idx = 0
+        self._save_lock = threading.Lock()
+        self._progress_cache = None
+        self._progress_bytes = None
+
+        self.error_categories = ERROR_CATEGORIES
+
         self._load_data()
         self._build_material_lookup()
         self._randomize_transitions()
@@ -103,59 +231,139 @@ class ValidationManager:
     
     def _load_data(self):
         """Load the transition validation data."""
-        with open(self.data_file, 'r') as f:
-            data = json.load(f)
-        
-        # Extract individual predictions from comparison data
-        if 'comparisons' in data:
-            for comparison in data['comparisons']:
-                for i, prediction in enumerate(comparison['predictions']):
-                    if not prediction.get('error'):
-                        transition = {
-                            'transition_id': f"{comparison['transition_id']}_{i}",
-                            'original_transition_id': comparison['transition_id'],
-                            'prediction_index': i,
-                            'action': comparison['action'],
-                            'input_materials': comparison['input_materials'],
-                            'input_observations': comparison['input_observations'],
-                            'prediction': prediction
-                        }
-                        self.transitions.append(transition)
+        self._n_transitions = 0
+        if ijson is not None and os.path.getsize(self.data_file) >= self.STREAM_PARSE_THRESHOLD:
+            self._load_data_streaming()
         else:
-            # Handle direct transition data format
-            self.transitions = data.get('transitions', [])
-        
-        self.metadata = data.get('metadata', {})
+            data = _read_json_file(self.data_file)
+
+            # Extract individual predictions from comparison data
+            if 'comparisons' in data:
+                comparisons = data['comparisons']
+                # Preallocate one slot per prediction (an exact upper bound)
+                # so the list never reallocates while filling; slots left by
+                # errored predictions are trimmed afterwards
+                self.transitions = [None] * sum(len(c.get('predictions') or ()) for c in comparisons)
+                for comparison in comparisons:
+                    self._add_comparison_transitions(comparison)
+                del self.transitions[self._n_transitions:]
+            else:
+                # Handle direct transition data format
+                self.transitions = [_intern_tree(t, depth=4) for t in data.get('transitions', [])]
+
+            self.metadata = data.get('metadata', {})
+
+        # Predictions are immutable after load, so the SECRET: truncation the
+        # template shows can be computed once here instead of per render
+        for transition in self.transitions:
+            self._precompute_truncated_reasoning(transition)
+
+        self._by_id = {t['transition_id']: t for t in self.transitions}
         print(f"Loaded {len(self.transitions)} transitions for validation")
+
+    def _load_data_streaming(self):
+        """Stream-parse a large data file one comparison at a time.
+
+        Avoids holding both the raw bytes and the fully parsed tree in
+        memory at once; only the comparison currently being processed is
+        resident.
+        """
+        # use_float: ijson defaults to Decimal for non-integer numbers,
+        # which orjson refuses to serialize when the transitions are
+        # rendered or exported
+        with open(self.data_file, 'rb') as f:
+            for comparison in ijson.items(f, 'comparisons.item', use_float=True):
+                self._add_comparison_transitions(comparison)
+
+        if not self.transitions:
+            # Direct transition data format
+            with open(self.data_file, 'rb') as f:
+                self.transitions = list(ijson.items(f, 'transitions.item', use_float=True))
+
+        self.metadata = {}
+        with open(self.data_file, 'rb') as f:
+            for metadata in ijson.items(f, 'metadata', use_float=True):
+                self.metadata = metadata
+                break
+
+    @staticmethod
+    def _precompute_truncated_reasoning(transition):
+        """Cache the SECRET:-truncated reasoning text on the prediction."""
+        inner = (transition.get('prediction') or {}).get('prediction')
+        if inner and inner.get('reasoning'):
+            reasoning = inner['reasoning']
+            secret_pos = reasoning.find("SECRET:")
+            inner['reasoning_truncated'] = (
+                reasoning[:secret_pos].strip() if secret_pos != -1 else reasoning
+            )
+
+    def _add_comparison_transitions(self, comparison):
+        """Append one transition per non-errored prediction in a comparison."""
+        # Intern the comparison before fanning out per prediction so the
+        # shared action/material dicts are deduplicated exactly once
+        comparison = _intern_tree(comparison, depth=4)
+        transitions = self.transitions
+        idx = self._n_transitions
+        for i, prediction in enumerate(comparison['predictions']):
+            if not prediction.get('error'):
+                transition = {
+                    'transition_id': f"{comparison['transition_id']}_{i}",
+                    'original_transition_id': comparison['transition_id'],
+                    'prediction_index': i,
+                    'action': comparison['action'],
+                    'input_materials': comparison['input_materials'],
+                    'input_observations': comparison['input_observations'],
+                    'prediction': prediction
+                }
+                # Fill preallocated slots when available, else grow normally
+                # (the streaming path has no size hint)
+                if idx < len(transitions):
+                    transitions[idx] = transition
+                else:
+                    transitions.append(transition)
+                idx += 1
+        self._n_transitions = idx
     
     def _build_material_lookup(self):
         """Build a lookup table from barcode to material name."""
         self.material_lookup = {}
-        
+        lookup_update = self.material_lookup.update
+
         for transition in self.transitions:
             # Build lookup from input materials
-            if transition.get('input_materials'):
-                for material in transition['input_materials']:
-                    if 'barcode' in material and 'name' in material:
-                        self.material_lookup[material['barcode']] = material['name']
-            
+            lookup_update(_barcode_name_pairs(transition.get('input_materials') or ()))
+
             # Also check predicted materials for any additional mappings
-            pred_materials = transition.get('prediction', {}).get('prediction', {}).get('new_materials', [])
-            for material in pred_materials:
-                if 'barcode' in material and 'name' in material:
-                    self.material_lookup[material['barcode']] = material['name']
+            pred_materials = ((transition.get('prediction') or {}).get('prediction') or {}).get('new_materials') or ()
+            lookup_update(_barcode_name_pairs(pred_materials))
         
+        # Membership set for the hot path in _resolve_barcode_to_name: most
+        # strings are not barcodes, so a set probe short-circuits the common case
+        self._barcode_set = set(self.material_lookup)
+
         print(f"Built material lookup table with {len(self.material_lookup)} entries")
+
+        # The lookup never changes after this point, so resolve barcodes in
+        # each transition once here rather than on every page load.
+        for transition in self.transitions:
+            transition['action'] = self._enhance_transition_with_names(transition)['action']
     
     def _randomize_transitions(self):
         """Randomize the order of transitions for validation."""
         # Set random seed for reproducible results across reviewers
         if self.random_seed is not None:
-            random.seed(self.random_seed)
             print(f"Using random seed: {self.random_seed} for reproducible order")
-        
-        self.current_transitions = self.transitions.copy()
-        random.shuffle(self.current_transitions)
+
+        if np is not None:
+            # Permute an index array at C speed instead of running a
+            # Python-level Fisher-Yates over the list of dicts
+            idx = np.random.default_rng(self.random_seed).permutation(len(self.transitions))
+            self.current_transitions = [self.transitions[i] for i in idx.tolist()]
+        else:
+            if self.random_seed is not None:
+                random.seed(self.random_seed)
+            self.current_transitions = self.transitions.copy()
+            random.shuffle(self.current_transitions)
         print(f"Randomized order of {len(self.current_transitions)} transitions")
     
     def _initialize_session_file(self):
@@ -172,10 +380,27 @@ class ValidationManager:
             'validations': []
         }
         
-        with open(self.session_file, 'w') as f:
-            json.dump(session_data, f, indent=2)
-        
+        with open(self.session_file, 'wb') as f:
+            f.write(_dumps(session_data))
+
+        self._open_validations_log()
+
         print(f"Initialized validation session file: {self.session_file}")
+
+    def _open_validations_log(self):
+        """Open the append-only JSONL log that records each validation."""
+        self.validations_log_file = self.session_file.with_suffix('.jsonl')
+        self._validations_log = open(self.validations_log_file, 'ab')
+        self._saves_since_sync = 0
+        atexit.register(self._finalize_session)
+
+    def _finalize_session(self):
+        """Flush the session summary and close the validations log."""
+        with self._save_lock:
+            if self.session_validations:
+                self._update_session_file()
+            if not self._validations_log.closed:
+                self._validations_log.close()
     
     @classmethod
     def resume_from_session(cls, session_file_path: str, data_file: str = None):
@@ -185,8 +410,8 @@ class ValidationManager:
             raise FileNotFoundError(f"Session file not found: {session_file_path}")
         
         # Load existing session data
-        with open(session_path, 'r') as f:
-            session_data = json.load(f)
+        with open(session_path, 'rb') as f:
+            session_data = _loads(f.read())
         
         # Use data file from session if not provided
         if data_file is None:
@@ -212,20 +437,45 @@ class ValidationManager:
         instance.current_transitions = []
         instance.completed_transitions = set()
         instance.session_validations = []
+        instance._next_idx = 0
+        instance._save_lock = threading.Lock()
+        instance._progress_cache = None
+        instance._progress_bytes = None
         
-        # Load error categories
-        instance.error_categories = session_data.get('error_categories', [])
+        # Load error categories (fall back to the current taxonomy)
+        instance.error_categories = session_data.get('error_categories') or ERROR_CATEGORIES
         
         # Load and setup transitions
         instance._load_data()
         instance._build_material_lookup()
         instance._randomize_transitions()
         
-        # Restore completed transitions and validations
-        instance.session_validations = session_data.get('validations', [])
+        # Restore completed transitions and validations. The JSONL log is
+        # authoritative since the summary is only rewritten periodically,
+        # but sessions predating the log (or saved between syncs) may hold
+        # records only in the summary, so merge both sources by id and
+        # backfill the log with anything it is missing.
+        log_file = session_path.with_suffix('.jsonl')
+        summary_validations = session_data.get('validations', [])
+        if log_file.exists():
+            with open(log_file, 'rb') as f:
+                instance.session_validations = [_loads(line) for line in f if line.strip()]
+            logged_ids = {v['transition_id'] for v in instance.session_validations}
+            unlogged = [v for v in summary_validations
+                        if v['transition_id'] not in logged_ids]
+            instance.session_validations.extend(unlogged)
+        else:
+            instance.session_validations = list(summary_validations)
+            unlogged = instance.session_validations
         instance.completed_transitions = set()
         for validation in instance.session_validations:
             instance.completed_transitions.add(validation['transition_id'])
+
+        instance._open_validations_log()
+        if unlogged:
+            for validation in unlogged:
+                instance._validations_log.write(_dumps_line(validation))
+            instance._validations_log.flush()
         
         print(f"Resumed session from: {session_path}")
         print(f"Progress: {len(instance.completed_transitions)}/{len(instance.current_transitions)} completed")
@@ -234,88 +484,169 @@ class ValidationManager:
     
     def get_next_transition(self) -> Optional[Dict[str, Any]]:
         """Get the next transition to validate."""
-        for transition in self.current_transitions:
-            if transition['transition_id'] not in self.completed_transitions:
-                # Add material lookup information to the transition
-                enhanced_transition = self._enhance_transition_with_names(transition)
-                return enhanced_transition
-        return None
+        # Advance the cursor past completed transitions instead of rescanning
+        # the whole list on every request; validations happen in cursor order,
+        # so this is O(1) amortized across a session.
+        while (self._next_idx < len(self.current_transitions) and
+               self.current_transitions[self._next_idx]['transition_id'] in self.completed_transitions):
+            self._next_idx += 1
+
+        if self._next_idx >= len(self.current_transitions):
+            return None
+
+        # Transitions already carry resolved material names (see
+        # _build_material_lookup), so no per-request enhancement is needed
+        return self.current_transitions[self._next_idx]
     
     def _enhance_transition_with_names(self, transition: Dict[str, Any]) -> Dict[str, Any]:
         """Enhance transition data by replacing barcodes with names in action parameters."""
-        enhanced = transition.copy()
-        
-        # Create a copy of action parameters with resolved names
-        if 'action' in enhanced and 'parameters' in enhanced['action']:
-            enhanced_params = {}
-            for key, value in enhanced['action']['parameters'].items():
-                enhanced_params[key] = self._resolve_barcode_to_name(value)
-            
-            enhanced['action'] = enhanced['action'].copy()
-            enhanced['action']['parameters'] = enhanced_params
-            enhanced['action']['parameters_display'] = enhanced_params  # Keep original for display
-        
-        return enhanced
+        action = transition.get('action')
+        if action and 'parameters' in action:
+            resolved = self._resolve_barcode_to_name(action['parameters'])
+            if resolved is not action['parameters']:
+                enhanced = transition.copy()
+                enhanced['action'] = action.copy()
+                enhanced['action']['parameters'] = resolved
+                return enhanced
+
+        # Nothing to resolve: hand back the original untouched
+        return transition
     
     def _resolve_barcode_to_name(self, value):
-        """Recursively resolve barcodes to names in nested data structures."""
-        if isinstance(value, str):
-            # Check if this looks like a barcode and we have a mapping for it
-            return self.material_lookup.get(value, value)
-        elif isinstance(value, list):
-            return [self._resolve_barcode_to_name(item) for item in value]
-        elif isinstance(value, dict):
-            return {k: self._resolve_barcode_to_name(v) for k, v in value.items()}
-        else:
-            return value
+        """Resolve barcodes to names in nested data structures.
+
+        Copy-on-write: containers are only duplicated along paths where a
+        barcode was actually replaced; subtrees with no barcodes come back
+        as the original objects with zero allocation.
+        """
+        # Exact type checks: JSON only produces str/list/dict, and `type is`
+        # dispatch is cheaper than isinstance on this hot path
+        t = type(value)
+        if t is str:
+            # Only strings that are known barcodes get replaced
+            return self.material_lookup[value] if value in self._barcode_set else value
+        if t is list:
+            new = None
+            for i, item in enumerate(value):
+                resolved = self._resolve_barcode_to_name(item)
+                if resolved is not item:
+                    if new is None:
+                        new = list(value)
+                    new[i] = resolved
+            return value if new is None else new
+        if t is dict:
+            new = None
+            for key, item in value.items():
+                resolved = self._resolve_barcode_to_name(item)
+                if resolved is not item:
+                    if new is None:
+                        new = value.copy()
+                    new[key] = resolved
+            return value if new is None else new
+        return value
     
     def save_validation(self, transition_id: str, is_plausible: bool, 
                        error_categories: List[str], custom_error: str = "",
                        comments: str = "", confidence: int = None, transition_data: Dict = None) -> None:
         """Save a validation result to the session file."""
+        # One timestamp per save, shared with the periodic summary rewrite
+        timestamp = datetime.datetime.now().isoformat()
         validation_result = {
             'transition_id': transition_id,
-            'timestamp': datetime.datetime.now().isoformat(),
+            'timestamp': timestamp,
             'is_plausible': is_plausible,
             'error_categories': error_categories,
             'custom_error': custom_error,
             'comments': comments,
             'confidence': confidence,
-            'transition_data': transition_data,
             'prediction_config': transition_data.get('prediction', {}).get('config', {}) if transition_data else {}
         }
         
-        self.session_validations.append(validation_result)
-        self._update_session_file()
-        self.completed_transitions.add(transition_id)
+        # Serialize writers: the server may handle requests on multiple threads
+        with self._save_lock:
+            self.session_validations.append(validation_result)
+            self._validations_log.write(_dumps_line(validation_result))
+            self._validations_log.flush()
+            self.completed_transitions.add(transition_id)
+
+            self._invalidate_progress()
+
+            self._saves_since_sync += 1
+            if self._saves_since_sync >= self.SESSION_SYNC_INTERVAL:
+                self._update_session_file(timestamp)
+                self._saves_since_sync = 0
         
         status = "plausible" if is_plausible else f"implausible ({len(error_categories)} errors)"
         print(f"Saved validation for {transition_id}: {status}")
     
-    def _update_session_file(self):
+    def _update_session_file(self, timestamp: str = None):
         """Update the session file with current validations."""
-        with open(self.session_file, 'r') as f:
-            session_data = json.load(f)
-        
+        with open(self.session_file, 'rb') as f:
+            session_data = _loads(f.read())
+
         session_data['validations'] = self.session_validations
-        session_data['last_updated'] = datetime.datetime.now().isoformat()
+        session_data['last_updated'] = timestamp or datetime.datetime.now().isoformat()
         session_data['completed_transitions'] = len(self.completed_transitions)
-        session_data['progress_percentage'] = (len(self.completed_transitions) / len(self.current_transitions)) * 100 if self.current_transitions else 0
-        
-        with open(self.session_file, 'w') as f:
-            json.dump(session_data, f, indent=2)
+
+        with open(self.session_file, 'wb') as f:
+            f.write(_dumps(session_data))
     
+    def export_full(self, path: str):
+        """Export validations with full transition data re-joined by id.
+
+        Validation records only store the transition_id; this rebuilds the
+        denormalized form for downstream analysis.
+        """
+        records = []
+        for validation in self.session_validations:
+            record = dict(validation)
+            record['transition_data'] = self._by_id.get(validation['transition_id'])
+            records.append(record)
+
+        with open(path, 'wb') as f:
+            f.write(_dumps({'session_id': self.session_id, 'validations': records}))
+
+        print(f"Exported {len(records)} full validation records to {path}")
+
+    def _invalidate_progress(self):
+        """Drop cached progress after a validation or skip."""
+        self._progress_cache = None
+        self._progress_bytes = None
+
     def get_progress(self) -> Dict[str, int]:
         """Get current progress statistics."""
-        return {
-            'completed': len(self.completed_transitions),
-            'total': len(self.current_transitions),
-            'remaining': len(self.current_transitions) - len(self.completed_transitions)
-        }
+        cached = self._progress_cache
+        if cached is None:
+            completed = len(self.completed_transitions)
+            total = len(self.current_transitions)
+            cached = {
+                'completed': completed,
+                'total': total,
+                'remaining': total - completed
+            }
+            self._progress_cache = cached
+        return cached
+
+    def get_progress_bytes(self) -> bytes:
+        """Pre-serialized form of get_progress for the polled /progress route."""
+        if self._progress_bytes is None:
+            self._progress_bytes = _dumps_compact(self.get_progress())
+        return self._progress_bytes
 
 # Global manager instance
 manager = None
 
+# Kept for templates/sessions that still pipe raw reasoning through the
+# filter; new renders use the reasoning_truncated field computed at load.
+@app.template_filter('truncate_at_secret')
+def truncate_at_secret(text):
+    if not text:
+        return text
+    secret_pos = text.find("SECRET:")
+    if secret_pos != -1:
+        return text[:secret_pos].strip()
+    return text
+
 @app.route('/')
 def index():
     """Main page showing current transition validation."""
@@ -333,7 +664,9 @@ def index():
 @app.route('/validate', methods=['POST'])
 def validate():
     """Handle validation submission."""
-    data = request.json
+    # get_json parses through the orjson provider and returns 400 on a
+    # malformed body rather than raising
+    data = request.get_json()
     
     transition_id = data['transition_id']
     is_plausible = data['is_plausible']
@@ -351,15 +684,16 @@ def validate():
 @app.route('/skip', methods=['POST'])
 def skip():
     """Skip current transition."""
-    data = request.json
+    data = request.get_json()
     transition_id = data['transition_id']
     manager.completed_transitions.add(transition_id)
+    manager._invalidate_progress()
     return jsonify({'status': 'success'})
 
 @app.route('/progress')
 def progress():
     """Get current progress."""
-    return jsonify(manager.get_progress())
+    return app.response_class(manager.get_progress_bytes(), mimetype='application/json')
 
 def main():
     parser = argparse.ArgumentParser(description='Web interface for validating LLM transitions')
@@ -377,6 +711,10 @@ def main():
                       help='Resume from existing validation session file (e.g., validation_session_20241201_143022.json)')
     parser.add_argument('--random-seed', default=42, type=int,
                       help='Random seed for reproducible ordering across reviewers (e.g., 42)')
+    parser.add_argument('--debug', action='store_true',
+                      help='Run the Flask development server with the debugger/reloader')
+    parser.add_argument('--threads', type=int, default=8,
+                      help='Number of server threads when running under waitress')
     
     args = parser.parse_args()
     
@@ -392,20 +730,13 @@ def main():
     else:
         manager = ValidationManager(args.data_file, args.results_dir, args.session_name, args.random_seed)
     
-    # Add custom filter to truncate reasoning at SECRET:
-    @app.template_filter('truncate_at_secret')
-    def truncate_at_secret(text):
-        if not text:
-            return text
-        secret_pos = text.find("SECRET:")
-        if secret_pos != -1:
-            return text[:secret_pos].strip()
-        return text
-    
     print(f"Starting validation interface on http://{args.host}:{args.port}")
     print(f"Press Ctrl+C to stop")
-    
-    app.run(host=args.host, port=args.port, debug=True)
+
+    if args.debug or waitress_serve is None:
+        app.run(host=args.host, port=args.port, debug=args.debug)
+    else:
+        waitress_serve(app, host=args.host, port=args.port, threads=args.threads)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file